@@ -18,3 +18,12 @@ except PackageNotFoundError:  # pragma: no cover
     __version__ = "unknown"
 finally:
     del version, PackageNotFoundError
+
+
+def __getattr__(name):
+    # ``AsyncPorkbunAPI`` pulls in asyncio, so it is only imported when actually used
+    if name == "AsyncPorkbunAPI":
+        from .async_api import AsyncPorkbunAPI
+
+        return AsyncPorkbunAPI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
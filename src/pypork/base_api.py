@@ -5,15 +5,77 @@ __author__ = "Urufusan"
 __copyright__ = "Urufusan"
 __license__ = "AGPL-3.0-or-later"
 
-import requests
+import copy
+import functools
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Literal
+from urllib.parse import urlsplit
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads
+
+
+_HEADERS = {"Content-Type": "application/json", "User-Agent": "pypork"}
+
+_SHARED_SESSIONS: dict[tuple[int, float], "requests.Session"] = {}
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session(retries: int, backoff_factor: float) -> "requests.Session":
+    """
+    Return the process-wide session for the given retry settings, creating it on first use.
+
+    Credentials travel in each request body, so clients for different accounts can safely share
+    one session and its warm connection pool.
+    """
+    key = (retries, backoff_factor)
+    session = _SHARED_SESSIONS.get(key)
+    if session is None:
+        with _SESSION_LOCK:
+            session = _SHARED_SESSIONS.get(key)
+            if session is None:
+                # ``requests`` is imported here rather than at module level, so importing pypork
+                # (e.g. just for ``PorkbunError`` or ``AsyncPorkbunAPI``) does not pay for it.
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                # Only requests the API provably did not act on are replayed: a POST whose response
+                # was lost, or that failed with a 500/502/504, may already have been applied, and
+                # replaying e.g. ``dns/create`` would create duplicate records. So reads are never
+                # retried, and of the error statuses only 429 is, plus 503 when it carries a
+                # Retry-After header (``respect_retry_after_header``).
+                retry = Retry(
+                    total=retries,
+                    read=False,
+                    backoff_factor=backoff_factor,
+                    status_forcelist=(429,),
+                    allowed_methods=frozenset({"POST"}),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+                session = requests.Session()
+                session.headers.update(_HEADERS)
+                # Two hosts: the main API and the IPv4-only ping endpoint
+                session.mount("https://", HTTPAdapter(max_retries=retry, pool_connections=2, pool_maxsize=32))
+                _SHARED_SESSIONS[key] = session
+    return session
 
 
 class PorkbunError(Exception):
     def __init__(self, message):
         if "record" in message:
-            message += f"\nSupported record types: {', '.join(PorkbunAPI.ALLOWEDTYPES)}"
-        elif "priority":
-            message += f"\nSupported record types with priority: {', '.join(PorkbunAPI.ALLOWEDTYPES_PRIO)}"
+            message += f"\nSupported record types: {PorkbunAPI._ALLOWED_STR}"
+        elif "priority" in message:
+            message += f"\nSupported record types with priority: {PorkbunAPI._ALLOWED_PRIO_STR}"
         super().__init__(message)
 
 
@@ -29,24 +91,37 @@ class PorkbunAPI:
 
     BASE_URL = "https://api.porkbun.com/api/json/v3"
     V4ONLYPINGURI = "https://api-ipv4.porkbun.com/api/json/v3"
-    ALLOWEDTYPES = ["A", "MX", "CNAME", "ALIAS", "TXT", "NS", "AAAA", "SRV", "TLSA", "CAA", "SVCB", "HTTPS"]
-    ALLOWEDTYPES_PRIO = ["SRV", "MX"]
+    ALLOWEDTYPES = frozenset({"A", "MX", "CNAME", "ALIAS", "TXT", "NS", "AAAA", "SRV", "TLSA", "CAA", "SVCB", "HTTPS"})
+    ALLOWEDTYPES_PRIO = frozenset({"SRV", "MX"})
+    _ALLOWED_STR = ", ".join(sorted(ALLOWEDTYPES))
+    _ALLOWED_PRIO_STR = ", ".join(sorted(ALLOWEDTYPES_PRIO))
 
     def set_domain(_method):
         """Sets the default domain, defined in ``__init__``, for all functions that use it"""
-        arg_name = "domain"
 
+        # ``domain`` is always the first parameter after ``self``, so any positional
+        # argument means the caller passed it explicitly.
+        @functools.wraps(_method)
         def wrapper(self, *args, **kwargs):
-            if getattr(self, arg_name, None):
-                if arg_name in kwargs and kwargs[arg_name] is None:
-                    kwargs[arg_name] = getattr(self, arg_name)
-                elif len(args) < _method.__code__.co_argcount - 1:
-                    kwargs[arg_name] = getattr(self, arg_name)
+            if not args and kwargs.get("domain") is None and self.domain:
+                kwargs["domain"] = self.domain
             return _method(self, *args, **kwargs)
 
         return wrapper
 
-    def __init__(self, api_key: str, secret_key: str, domain: str = None, check_creds: bool = True):
+    def __init__(
+        self,
+        api_key: str,
+        secret_key: str,
+        domain: str = None,
+        check_creds: bool = True,
+        ddns_cache_file: str = None,
+        retries: int = 3,
+        backoff_factor: float = 0.3,
+        timeout: float | tuple[float, float] = (3.05, 27),
+        read_cache: bool = False,
+        http_backend: Literal["requests", "httpx", "stdlib"] = "requests",
+    ):
         """
         Initialize the Porkbun API client.
 
@@ -54,41 +129,249 @@ class PorkbunAPI:
         :param secret_key: Your Porkbun secret API key.
         :param domain: The domain you want to use by default (will be used as `domain` arg in functions, but can be left empty)
         :param check_creds: Check the provided credentials
+        :param ddns_cache_file: JSON file used to remember the last IP pushed by ``ddns_update`` across restarts (optional)
+        :param retries: How many times a request is retried on connection errors, 429 responses or a 503 with Retry-After (default: 3)
+        :param backoff_factor: Exponential backoff factor between retries, in seconds (default: 0.3)
+        :param timeout: Request timeout in seconds, or a ``(connect, read)`` tuple (default: ``(3.05, 27)``)
+        :param read_cache: Cache DNS record and name server reads for the lowest TTL of the returned records (default: False)
+        :param http_backend: ``"requests"`` (default), ``"httpx"`` for an HTTP/2 client that multiplexes concurrent calls over one connection,
+            or ``"stdlib"`` for a dependency-free :mod:`http.client` connection (ignores ``retries``, only reconnecting when a kept-alive connection was closed by the server before the request could be sent; suited to one-off scripts such as DDNS cron jobs)
         """
         self.api_key = api_key
         self.secret_key = secret_key
         self.domain = domain
+        self._auth_payload = {"apikey": api_key, "secretapikey": secret_key}
+        self._base_url = self.BASE_URL
+        self._timeout = timeout
+        self._http_backend = http_backend
+        if http_backend == "requests":
+            import requests
+
+            self._session = _get_session(retries, backoff_factor)
+            self._request_timeout = timeout
+            self._timeout_error = requests.Timeout
+        elif http_backend == "httpx":
+            import httpx
+
+            connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+            self._session = httpx.Client(
+                headers=_HEADERS,
+                # httpx only retries failed connections, not error responses
+                transport=httpx.HTTPTransport(http2=True, retries=retries),
+            )
+            self._request_timeout = httpx.Timeout(read, connect=connect)
+            self._timeout_error = httpx.TimeoutException
+        elif http_backend == "stdlib":
+            self._session = None
+            self._stdlib_conns: dict[str, "http.client.HTTPSConnection"] = {}
+            self._stdlib_lock = threading.Lock()
+            self._request_timeout = max(timeout) if isinstance(timeout, tuple) else timeout
+            self._timeout_error = socket.timeout
+        else:
+            raise ValueError(f"Unknown http_backend {http_backend!r}, expected 'requests', 'httpx' or 'stdlib'")
+        self._ping_cache: dict[bool, tuple[float, dict]] = {}
+        self.ping_ttl = 60
+        self.read_cache = read_cache
+        self.read_cache_default_ttl = 60
+        self._read_cache: dict[str, tuple[float, dict]] = {}
+        self._ddns_cache_file = ddns_cache_file
+        self._ddns_last: dict[tuple[str, str, str], str] = self._load_ddns_cache()
         if check_creds:
-            _ping = self.ping()
+            # Only caches the dual-stack ping; ``ddns_update()`` defaults to the IPv4-only endpoint
+            _ping = self.ping(force=True)
             if _ping["status"] == "ERROR":
                 raise ConnectionRefusedError(_ping["message"])
 
-    def _post(self, endpoint: str, data: dict = None) -> dict:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Release the client's connections.
+
+        With the ``requests`` backend the connection pool is shared by all clients in the process, so it is left open for them.
+        """
+        if self._http_backend == "httpx":
+            self._session.close()
+        elif self._http_backend == "stdlib":
+            with self._stdlib_lock:
+                for conn in self._stdlib_conns.values():
+                    conn.close()
+                self._stdlib_conns.clear()
+
+    def batch(self, thunks: list[Callable[[], dict]], max_workers: int = 8) -> list[dict | Exception]:
+        """
+        Run several independent API calls concurrently over the shared session.
+
+        Example: ``pb.batch([lambda: pb.get_dns_records("a.com"), lambda: pb.get_dns_records("b.com")])``
+
+        :param thunks: Zero-argument callables, each performing one API call.
+        :param max_workers: Maximum number of calls running at the same time (default: 8).
+        :return: The results in the same order as ``thunks``; a call that raised is returned as its exception.
+        """
+        with ThreadPoolExecutor(max_workers) as executor:
+            futures = [executor.submit(thunk) for thunk in thunks]
+        results = []
+        for future in futures:
+            exc = future.exception()
+            results.append(future.result() if exc is None else exc)
+        return results
+
+    def _norm_and_validate_type(self, record_type: str, prio: int = None) -> str:
+        """
+        Normalize a record type and check it (and the use of ``prio``) against the types Porkbun supports.
+
+        :param record_type: The type of DNS record (case-insensitive).
+        :param prio: Priority passed along with the record (optional).
+        :return: The upper-cased record type.
+        """
+        record_type = record_type.upper()
+        if record_type not in self.ALLOWEDTYPES:
+            raise PorkbunError(f"Type {record_type} is not a valid record type supported by Porkbun")
+        if prio and record_type not in self.ALLOWEDTYPES_PRIO:
+            raise PorkbunError(f"Your request type {record_type} does not support priority")
+        return record_type
+
+    def _send(self, url: str, payload: dict) -> dict:
+        """
+        POST ``payload`` to ``url`` over the session and decode the JSON response.
+
+        :raises PorkbunError: If the request times out.
+        """
+        try:
+            if self._http_backend == "stdlib":
+                return self._send_stdlib(url, payload)
+            response = self._session.post(url, json=payload, timeout=self._request_timeout)
+        except self._timeout_error as e:
+            total = sum(self._timeout) if isinstance(self._timeout, tuple) else self._timeout
+            raise PorkbunError("timeout after %.1fs" % total) from e
+        return _json_loads(response.content)
+
+    def _send_stdlib(self, url: str, payload: dict) -> dict:
+        """
+        ``_send`` for the ``stdlib`` backend, keeping one :mod:`http.client` connection per host open between calls.
+
+        A connection that fails in any way is closed and forgotten, so the next call starts afresh. The request is
+        only resent when a reused connection fails while sending it, i.e. the server had already dropped it; once
+        the request went out, or on a fresh connection, the error is raised as it may already have been applied.
+        """
+        import http.client
+
+        parts = urlsplit(url)
+        body = json.dumps(payload).encode()
+        with self._stdlib_lock:
+            while True:
+                conn = self._stdlib_conns.get(parts.netloc)
+                reused = conn is not None
+                if not reused:
+                    conn = http.client.HTTPSConnection(parts.netloc, timeout=self._request_timeout)
+                    self._stdlib_conns[parts.netloc] = conn
+                sent = False
+                try:
+                    conn.request("POST", parts.path, body, _HEADERS)
+                    sent = True
+                    return _json_loads(conn.getresponse().read())
+                except Exception as e:
+                    conn.close()
+                    del self._stdlib_conns[parts.netloc]
+                    if sent or not reused or not isinstance(e, ConnectionError):
+                        raise
+
+    def _post(self, endpoint: str, data: dict = None, base_url: str = None) -> dict:
         """
         Helper method to make a POST request to the Porkbun API.
 
         :param endpoint: The API endpoint (excluding the base URL).
         :param data: Additional payload data for the request.
+        :param base_url: Override the base URL (used by the IPv4-only ping).
         :return: JSON response as a dictionary.
         """
-        url = f"{self.BASE_URL}/{endpoint}"
-        payload = {"apikey": self.api_key, "secretapikey": self.secret_key}
-        if data:
-            payload.update(data)
-        response = requests.post(url, json=payload)
-        return response.json()
-
-    def ping(self, ipv4only: bool = False) -> dict:
+        # Without extra data the shared auth dict is sent as-is; it is only serialized, never mutated.
+        payload = {**self._auth_payload, **data} if data else self._auth_payload
+        return self._send(f"{base_url or self._base_url}/{endpoint}", payload)
+
+    def _cached_post(self, endpoint: str, bypass_cache: bool = False) -> dict:
+        """
+        ``_post`` for read-only endpoints, going through the read cache when ``read_cache`` is enabled.
+
+        :param endpoint: The API endpoint (excluding the base URL), which is also the cache key.
+        :param bypass_cache: Always contact the API (the fresh response is still cached).
+        :return: JSON response as a dictionary (a copy, so callers may modify it without affecting the cache).
+        """
+        if not self.read_cache:
+            return self._post(endpoint)
+        if not bypass_cache:
+            expires, val = self._read_cache.get(endpoint, (0, None))
+            if val is not None and time.monotonic() < expires:
+                return copy.deepcopy(val)
+        result = self._post(endpoint)
+        if result.get("status") == "SUCCESS":
+            default = self.read_cache_default_ttl
+            ttl = min((int(r.get("ttl", default)) for r in result.get("records", [])), default=default)
+            self._read_cache[endpoint] = (time.monotonic() + ttl, copy.deepcopy(result))
+        return result
+
+    def _invalidate_caches(self, domain: str):
+        """
+        Forget everything cached about ``domain`` after the client changed it.
+
+        Drops cached reads (their endpoints all have the domain as third path segment) and the IPs
+        ``ddns_update`` last pushed, so the next update is sent even if the record was edited or deleted.
+        """
+        for key in list(self._read_cache):
+            if key.split("/")[2] == domain:
+                self._read_cache.pop(key, None)
+        stale = [key for key in self._ddns_last if key[0] == domain]
+        if stale:
+            for key in stale:
+                self._ddns_last.pop(key, None)
+            self._save_ddns_cache()
+
+    def _load_ddns_cache(self) -> dict[tuple[str, str, str], str]:
+        """Read the ``ddns_cache_file``, treating a missing, unreadable or malformed file as empty."""
+        if not self._ddns_cache_file:
+            return {}
+        try:
+            with open(self._ddns_cache_file) as f:
+                return {(d, sub, rt): ipaddr for d, sub, rt, ipaddr in json.load(f)}
+        except (OSError, ValueError, TypeError):
+            return {}
+
+    def _save_ddns_cache(self):
+        """Atomically replace the ``ddns_cache_file`` (if any), so an interrupted write never leaves a partial file."""
+        if not self._ddns_cache_file:
+            return
+        directory, name = os.path.split(os.path.abspath(self._ddns_cache_file))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump([[*k, v] for k, v in self._ddns_last.items()], f)
+            os.replace(tmp_path, self._ddns_cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def ping(self, ipv4only: bool = False, force: bool = False) -> dict:
         """
         Test communication with the Porkbun API.
 
+        Successful responses are cached for ``ping_ttl`` seconds (default: 60).
+
         :param ipv4only: Whether to use IPv4 only (default: False).
-        :return: JSON response with API status and your public IP.
-        """
-        url = f"{self.V4ONLYPINGURI if ipv4only else self.BASE_URL}/ping"
-        payload = {"apikey": self.api_key, "secretapikey": self.secret_key}
-        response = requests.post(url, json=payload)
-        return response.json()
+        :param force: Skip the cache and always contact the API (default: False).
+        :return: JSON response with API status and your public IP (a copy, so callers may modify it without affecting the cache).
+        """
+        if not force:
+            ts, val = self._ping_cache.get(ipv4only, (0, None))
+            if val is not None and time.monotonic() - ts < self.ping_ttl:
+                return copy.deepcopy(val)
+        result = self._post("ping", base_url=self.V4ONLYPINGURI if ipv4only else None)
+        if result.get("status") == "SUCCESS":
+            self._ping_cache[ipv4only] = (time.monotonic(), copy.deepcopy(result))
+        return result
 
     def get_domain_pricing(self) -> dict:
         """
@@ -119,14 +402,15 @@ class PorkbunAPI:
         return self._post(f"domain/checkDomain/{domain}")
 
     @set_domain
-    def get_name_servers(self, domain: str) -> dict:
+    def get_name_servers(self, domain: str, bypass_cache: bool = False) -> dict:
         """
         Retrieve the authoritative name servers for a domain.
 
         :param domain: The domain to check.
+        :param bypass_cache: Skip the read cache and always contact the API (default: False).
         :return: JSON dict containing the name servers.
         """
-        return self._post(f"domain/getNs/{domain}")
+        return self._cached_post(f"domain/getNs/{domain}", bypass_cache)
 
     @set_domain
     def update_name_servers(self, domain: str, name_servers: list) -> dict:
@@ -137,7 +421,9 @@ class PorkbunAPI:
         :param name_servers: List of name servers to assign.
         :return: JSON dict with the update status.
         """
-        return self._post(f"domain/updateNs/{domain}", {"ns": name_servers})
+        result = self._post(f"domain/updateNs/{domain}", {"ns": name_servers})
+        self._invalidate_caches(domain)
+        return result
 
     @set_domain
     def create_dns_record(self, domain: str, name: str, record_type: str, content: str, ttl: int = 600, prio: int = None) -> dict:
@@ -152,25 +438,24 @@ class PorkbunAPI:
         :param prio: Priority for records like MX (optional).
         :return: JSON dict with the created record ID.
         """
-        record_type = record_type.upper()
-        if record_type not in self.ALLOWEDTYPES:
-            raise PorkbunError(f"Type {record_type} is not a valid record type supported by Porkbun")
+        record_type = self._norm_and_validate_type(record_type, prio)
         data = {"name": name, "type": record_type, "content": content, "ttl": str(ttl)}
         if prio:
-            if record_type not in self.ALLOWEDTYPES_PRIO:
-                raise PorkbunError(f"Your request type {record_type} does not support priority")
             data["prio"] = str(prio)
-        return self._post(f"dns/create/{domain}", data)
+        result = self._post(f"dns/create/{domain}", data)
+        self._invalidate_caches(domain)
+        return result
 
     @set_domain
-    def get_dns_records(self, domain: str) -> dict:
+    def get_dns_records(self, domain: str, bypass_cache: bool = False) -> dict:
         """
         Retrieve all DNS records for a given domain.
 
         :param domain: The domain name.
+        :param bypass_cache: Skip the read cache and always contact the API (default: False).
         :return: JSON dict containing the DNS records.
         """
-        return self._post(f"dns/retrieve/{domain}")
+        return self._cached_post(f"dns/retrieve/{domain}", bypass_cache)
 
     @set_domain
     def edit_dns_record(self, domain: str, record_id: str | int, name: str, record_type: str, content: str, ttl: int = 600, prio: int = None) -> dict:
@@ -186,15 +471,13 @@ class PorkbunAPI:
         :param prio: Priority (for MX records, optional).
         :return: JSON dict with update status.
         """
-        record_type = record_type.upper()
-        if record_type not in self.ALLOWEDTYPES:
-            raise PorkbunError(f"Type {record_type} is not a valid record type supported by Porkbun")
+        record_type = self._norm_and_validate_type(record_type, prio)
         data = {"name": name, "type": record_type, "content": content, "ttl": str(ttl)}
         if prio:
-            if record_type not in self.ALLOWEDTYPES_PRIO:
-                raise PorkbunError(f"Your request type {record_type} does not support priority")
             data["prio"] = str(prio)
-        return self._post(f"dns/edit/{domain}/{record_id}", data)
+        result = self._post(f"dns/edit/{domain}/{record_id}", data)
+        self._invalidate_caches(domain)
+        return result
 
     @set_domain
     def delete_dns_record(self, domain: str, record_id: str | int) -> dict:
@@ -205,7 +488,9 @@ class PorkbunAPI:
         :param record_id: The ID of the DNS record to delete.
         :return: JSON dict with deletion status.
         """
-        return self._post(f"dns/delete/{domain}/{record_id}")
+        result = self._post(f"dns/delete/{domain}/{record_id}")
+        self._invalidate_caches(domain)
+        return result
 
     @set_domain
     def edit_dns_record_by_name_type(
@@ -222,30 +507,27 @@ class PorkbunAPI:
         :param prio: Priority for records like MX (optional).
         :return: JSON dict with update status.
         """
-        record_type = record_type.upper()
-        if record_type not in self.ALLOWEDTYPES:
-            raise PorkbunError(f"Type {record_type} is not a valid record type supported by Porkbun")
+        record_type = self._norm_and_validate_type(record_type, prio)
         data = {"content": content, "ttl": str(ttl)}
         if prio:
-            if record_type not in self.ALLOWEDTYPES_PRIO:
-                raise PorkbunError(f"Your request type {record_type} does not support priority")
             data["prio"] = str(prio)
-        return self._post(f"dns/editByNameType/{domain}/{record_type}/{subdomain}", data)
+        result = self._post(f"dns/editByNameType/{domain}/{record_type}/{subdomain}", data)
+        self._invalidate_caches(domain)
+        return result
 
     @set_domain
-    def get_dns_records_by_name_type(self, domain: str, record_type: str, subdomain: str = "") -> dict:
+    def get_dns_records_by_name_type(self, domain: str, record_type: str, subdomain: str = "", bypass_cache: bool = False) -> dict:
         """
         Retrieve DNS records by name and type.
 
         :param domain: The domain name.
         :param record_type: The type of DNS record (A, MX, CNAME, etc.).
         :param subdomain: The subdomain for the record (default: root).
+        :param bypass_cache: Skip the read cache and always contact the API (default: False).
         :return: JSON dict containing the DNS records.
         """
-        record_type = record_type.upper()
-        if record_type not in self.ALLOWEDTYPES:
-            raise PorkbunError(f"Type {record_type} is not a valid record type supported by Porkbun")
-        return self._post(f"dns/retrieveByNameType/{domain}/{record_type}/{subdomain}")
+        record_type = self._norm_and_validate_type(record_type)
+        return self._cached_post(f"dns/retrieveByNameType/{domain}/{record_type}/{subdomain}", bypass_cache)
 
     @set_domain
     def delete_dns_record_by_name_type(self, domain: str, record_type: str, subdomain: str = "") -> dict:
@@ -257,10 +539,10 @@ class PorkbunAPI:
         :param subdomain: The subdomain for the record (default: root).
         :return: JSON dict with deletion status.
         """
-        record_type = record_type.upper()
-        if record_type not in self.ALLOWEDTYPES:
-            raise PorkbunError(f"Type {record_type} is not a valid record type supported by Porkbun")
-        return self._post(f"dns/deleteByNameType/{domain}/{record_type}/{subdomain}")
+        record_type = self._norm_and_validate_type(record_type)
+        result = self._post(f"dns/deleteByNameType/{domain}/{record_type}/{subdomain}")
+        self._invalidate_caches(domain)
+        return result
 
     @set_domain
     def add_url_forwarding(
@@ -318,14 +600,21 @@ class PorkbunAPI:
         :param ip: The IP address to update (optional).
         :param subdomain: The subdomain for the record (default: root).
         :param ipv4only: Whether to use IPv4 only (default: True).
-        :return: JSON dict with update status.
+        :return: JSON dict with update status (``"cached": True`` if the record already had this IP and no request was made).
         """
         if ip:
             ipaddr = ip
         else:
             ipaddr = self.ping(ipv4only=ipv4only)["yourIp"]
         record_type = "A" if ipv4only or ":" not in ipaddr else "AAAA"
-        return self.edit_dns_record_by_name_type(domain, record_type, ipaddr, subdomain)
+        key = (domain, subdomain, record_type)
+        if self._ddns_last.get(key) == ipaddr:
+            return {"status": "SUCCESS", "cached": True}
+        result = self.edit_dns_record_by_name_type(domain, record_type, ipaddr, subdomain)
+        if result.get("status") == "SUCCESS":
+            self._ddns_last[key] = ipaddr
+            self._save_ddns_cache()
+        return result
 
     @set_domain
     def create_dnssec_record(
@@ -1,10 +1,39 @@
 """
-    Dummy conftest.py for pypork.
+    Shared fixtures for the pypork tests.
 
-    If you don't know what this is for, just leave it empty.
     Read more about conftest.py under:
     - https://docs.pytest.org/en/stable/fixture.html
     - https://docs.pytest.org/en/stable/writing_plugins.html
 """
 
-# import pytest
+import pytest
+
+from pypork.base_api import PorkbunAPI
+
+
+class FakeSend:
+    """Stand-in for ``PorkbunAPI._send`` that records requests and answers from a callback."""
+
+    def __init__(self, respond=None):
+        self.calls = []
+        self.respond = respond or (lambda url, payload: {"status": "SUCCESS"})
+
+    def __call__(self, url, payload):
+        self.calls.append((url, payload))
+        return self.respond(url, payload)
+
+    @property
+    def endpoints(self):
+        return [url.split("/json/v3/", 1)[1] for url, _ in self.calls]
+
+
+@pytest.fixture
+def make_client():
+    """Factory for clients that never touch the network; requests go to a :class:`FakeSend` on ``pb._send``."""
+
+    def factory(respond=None, **kwargs):
+        pb = PorkbunAPI("pk1_key", "sk1_secret", check_creds=False, **kwargs)
+        pb._send = FakeSend(respond)
+        return pb
+
+    return factory
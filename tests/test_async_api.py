@@ -0,0 +1,77 @@
+import asyncio
+import inspect
+import subprocess
+import sys
+
+import pytest
+
+import pypork
+from pypork.base_api import PorkbunError
+
+__author__ = "Urufusan"
+__copyright__ = "Urufusan"
+__license__ = "AGPL-3.0-or-later"
+
+
+def make_client(**kwargs):
+    pb = pypork.AsyncPorkbunAPI("pk1_key", "sk1_secret", check_creds=False, **kwargs)
+    calls = []
+
+    async def fake_post(endpoint, data=None, base_url=None):
+        calls.append(endpoint)
+        await asyncio.sleep(0)
+        return {"status": "SUCCESS", "endpoint": endpoint}
+
+    pb._post = fake_post
+    return pb, calls
+
+
+def test_import_does_not_load_asyncio():
+    code = "import sys, pypork; assert 'asyncio' not in sys.modules; pypork.AsyncPorkbunAPI; assert 'asyncio' in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        pypork.NoSuchClient
+
+
+@pytest.mark.parametrize("name", ["get_dns_records", "create_dns_record", "ddns_update", "ping", "get_domain_pricing"])
+def test_methods_are_coroutine_functions(name):
+    assert inspect.iscoroutinefunction(getattr(pypork.AsyncPorkbunAPI, name))
+
+
+def test_default_domain_and_gather():
+    pb, calls = make_client(domain="example.com")
+
+    async def main():
+        return await asyncio.gather(pb.get_dns_records(), pb.get_dns_records("other.com"), pb.get_name_servers(domain=None))
+
+    results = asyncio.run(main())
+    assert [r["endpoint"] for r in results] == ["dns/retrieve/example.com", "dns/retrieve/other.com", "domain/getNs/example.com"]
+    assert len(calls) == 3
+
+
+def test_record_type_validation():
+    pb, calls = make_client(domain="example.com")
+    with pytest.raises(PorkbunError):
+        asyncio.run(pb.create_dns_record(name="www", record_type="BOGUS", content="x"))
+    assert calls == []
+
+
+class TimeoutSession:
+    closed = False
+
+    def post(self, url, json=None):
+        raise asyncio.TimeoutError
+
+    async def close(self):
+        self.closed = True
+
+
+def test_timeout_raises_porkbun_error():
+    pb = pypork.AsyncPorkbunAPI("pk1_key", "sk1_secret", check_creds=False, timeout=(1, 0.5))
+    pb._session = TimeoutSession()
+    pb._semaphore = asyncio.Semaphore(1)
+    with pytest.raises(PorkbunError, match=r"^timeout after 1\.5s$"):
+        asyncio.run(pb.get_domain_pricing())
@@ -0,0 +1,38 @@
+import threading
+
+from pypork.base_api import PorkbunError
+
+__author__ = "Urufusan"
+__copyright__ = "Urufusan"
+__license__ = "AGPL-3.0-or-later"
+
+
+def test_batch_keeps_order_and_captures_exceptions(make_client):
+    pb = make_client(lambda url, payload: {"status": "SUCCESS", "url": url}, domain="example.com")
+    results = pb.batch(
+        [
+            lambda: pb.get_dns_records("a.com"),
+            lambda: pb.create_dns_record(name="www", record_type="BOGUS", content="x"),
+            lambda: pb.get_dns_records("b.com"),
+        ]
+    )
+    assert results[0]["url"].endswith("dns/retrieve/a.com")
+    assert isinstance(results[1], PorkbunError)
+    assert results[2]["url"].endswith("dns/retrieve/b.com")
+
+
+def test_batch_runs_calls_concurrently(make_client):
+    barrier = threading.Barrier(3, timeout=5)
+
+    def respond(url, payload):
+        # Only returns once all three calls are in flight at the same time
+        barrier.wait()
+        return {"status": "SUCCESS"}
+
+    pb = make_client(respond, domain="example.com")
+    results = pb.batch([pb.get_dns_records] * 3, max_workers=3)
+    assert results == [{"status": "SUCCESS"}] * 3
+
+
+def test_batch_empty(make_client):
+    assert make_client().batch([]) == []
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+__author__ = "Urufusan"
+__copyright__ = "Urufusan"
+__license__ = "AGPL-3.0-or-later"
+
+
+def test_ddns_update_skips_unchanged_ip(make_client):
+    pb = make_client(lambda url, payload: {"status": "SUCCESS", **({"yourIp": "192.0.2.10"} if url.endswith("/ping") else {})}, domain="example.com")
+    first = pb.ddns_update(subdomain="home")
+    second = pb.ddns_update(subdomain="home")
+    assert first == {"status": "SUCCESS"}
+    assert second == {"status": "SUCCESS", "cached": True}
+    assert pb._send.endpoints == ["ping", "dns/editByNameType/example.com/A/home"]
+
+
+def test_ddns_update_pushes_changed_ip_and_other_subdomains(make_client):
+    pb = make_client(domain="example.com")
+    pb.ddns_update(ip="192.0.2.1", subdomain="home")
+    pb.ddns_update(ip="192.0.2.2", subdomain="home")
+    pb.ddns_update(ip="192.0.2.2", subdomain="office")
+    assert len(pb._send.calls) == 3
+
+
+def test_ddns_update_failure_is_not_remembered(make_client):
+    pb = make_client(lambda url, payload: {"status": "ERROR", "message": "Edit error"}, domain="example.com")
+    pb.ddns_update(ip="192.0.2.1")
+    pb.ddns_update(ip="192.0.2.1")
+    assert len(pb._send.calls) == 2
+
+
+def test_ddns_cache_file_persists_between_clients(tmp_path, make_client):
+    cache_file = tmp_path / "ddns.json"
+    pb = make_client(domain="example.com", ddns_cache_file=str(cache_file))
+    pb.ddns_update(ip="192.0.2.1", subdomain="home")
+    assert json.loads(cache_file.read_text()) == [["example.com", "home", "A", "192.0.2.1"]]
+
+    pb2 = make_client(domain="example.com", ddns_cache_file=str(cache_file))
+    assert pb2.ddns_update(ip="192.0.2.1", subdomain="home")["cached"] is True
+    assert pb2._send.calls == []
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda pb: pb.delete_dns_record_by_name_type(record_type="A", subdomain="home"),
+        lambda pb: pb.edit_dns_record_by_name_type(record_type="A", content="192.0.2.99", subdomain="home"),
+        lambda pb: pb.delete_dns_record(record_id=1),
+    ],
+)
+def test_writes_forget_pushed_ip(write, tmp_path, make_client):
+    cache_file = tmp_path / "ddns.json"
+    pb = make_client(domain="example.com", ddns_cache_file=str(cache_file))
+    pb.ddns_update(ip="192.0.2.1", subdomain="home")
+    pb.ddns_update("other.com", ip="192.0.2.1", subdomain="home")
+    write(pb)
+    assert json.loads(cache_file.read_text()) == [["other.com", "home", "A", "192.0.2.1"]]
+    assert "cached" not in pb.ddns_update(ip="192.0.2.1", subdomain="home")
+
+    pb2 = make_client(domain="example.com", ddns_cache_file=str(cache_file))
+    assert pb2.ddns_update("other.com", ip="192.0.2.1", subdomain="home")["cached"] is True
+
+
+@pytest.mark.parametrize("content", ["", "{not json", '{"a": 1}', "[[1, 2]]", "null"])
+def test_malformed_cache_file_starts_empty(content, tmp_path, make_client):
+    cache_file = tmp_path / "ddns.json"
+    cache_file.write_text(content)
+    pb = make_client(domain="example.com", ddns_cache_file=str(cache_file))
+    assert pb._ddns_last == {}
+    pb.ddns_update(ip="192.0.2.1")
+    assert json.loads(cache_file.read_text()) == [["example.com", "", "A", "192.0.2.1"]]
+
+
+def test_failed_cache_write_keeps_old_file(monkeypatch, tmp_path, make_client):
+    cache_file = tmp_path / "ddns.json"
+    pb = make_client(domain="example.com", ddns_cache_file=str(cache_file))
+    pb.ddns_update(ip="192.0.2.1")
+    old = cache_file.read_text()
+
+    def broken_dump(obj, f):
+        f.write("[[")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(json, "dump", broken_dump)
+    with pytest.raises(OSError, match="disk full"):
+        pb.ddns_update(ip="192.0.2.2")
+    assert cache_file.read_text() == old
+    assert [p.name for p in tmp_path.iterdir()] == ["ddns.json"]
@@ -0,0 +1,22 @@
+import pytest
+
+from pypork.base_api import PorkbunError
+
+__author__ = "Urufusan"
+__copyright__ = "Urufusan"
+__license__ = "AGPL-3.0-or-later"
+
+
+@pytest.mark.parametrize(
+    "record_type, prio, hint",
+    [("BOGUS", None, "Supported record types:"), ("A", 10, "Supported record types with priority:")],
+)
+def test_invalid_record_type_or_priority(record_type, prio, hint, make_client):
+    pb = make_client(domain="example.com")
+    with pytest.raises(PorkbunError, match=hint):
+        pb.create_dns_record(name="www", record_type=record_type, content="x", prio=prio)
+    assert pb._send.calls == []
+
+
+def test_error_without_record_or_priority_gets_no_hint():
+    assert str(PorkbunError("timeout after 1.0s")) == "timeout after 1.0s"
@@ -0,0 +1,40 @@
+import pytest
+
+from pypork.base_api import PorkbunAPI, PorkbunError
+
+httpx = pytest.importorskip("httpx")
+
+__author__ = "Urufusan"
+__copyright__ = "Urufusan"
+__license__ = "AGPL-3.0-or-later"
+
+
+@pytest.mark.parametrize("timeout, connect, read", [((3.05, 27), 3.05, 27), (10, 10, 10)])
+def test_timeout_is_mapped_to_httpx(timeout, connect, read):
+    pb = PorkbunAPI("pk1_key", "sk1_secret", check_creds=False, timeout=timeout, http_backend="httpx")
+    assert isinstance(pb._request_timeout, httpx.Timeout)
+    assert (pb._request_timeout.connect, pb._request_timeout.read) == (connect, read)
+    pb.close()
+
+
+class TimeoutSession:
+    def __init__(self, exc):
+        self.exc = exc
+
+    def post(self, url, json=None, timeout=None):
+        raise self.exc
+
+
+@pytest.mark.parametrize("exc", [httpx.ReadTimeout("read"), httpx.ConnectTimeout("connect")])
+def test_timeouts_raise_porkbun_error(exc):
+    pb = PorkbunAPI("pk1_key", "sk1_secret", check_creds=False, timeout=(1, 0.5), http_backend="httpx")
+    pb._session.close()
+    pb._session = TimeoutSession(exc)
+    with pytest.raises(PorkbunError, match=r"^timeout after 1\.5s$"):
+        pb.get_domain_pricing()
+
+
+def test_close_closes_client():
+    with PorkbunAPI("pk1_key", "sk1_secret", check_creds=False, http_backend="httpx") as pb:
+        assert not pb._session.is_closed
+    assert pb._session.is_closed
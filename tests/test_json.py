@@ -0,0 +1,26 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from pypork import base_api
+
+__author__ = "Urufusan"
+__copyright__ = "Urufusan"
+__license__ = "AGPL-3.0-or-later"
+
+
+def test_falls_back_to_stdlib_json_without_orjson():
+    code = "import sys, json; sys.modules['orjson'] = None; from pypork import base_api; assert base_api._json_loads is json.loads"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_uses_orjson_when_installed():
+    orjson = pytest.importorskip("orjson")
+    assert base_api._json_loads is orjson.loads
+
+
+def test_parses_response_bytes():
+    body = json.dumps({"status": "SUCCESS", "yourIp": "192.0.2.1", "records": [{"ttl": "600"}]}).encode()
+    assert base_api._json_loads(body) == {"status": "SUCCESS", "yourIp": "192.0.2.1", "records": [{"ttl": "600"}]}
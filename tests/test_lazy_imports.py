@@ -0,0 +1,25 @@
+import subprocess
+import sys
+
+import pytest
+
+__author__ = "Urufusan"
+__copyright__ = "Urufusan"
+__license__ = "AGPL-3.0-or-later"
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import pypork",
+        "from pypork.base_api import PorkbunError",
+        "import pypork; pypork.PorkbunAPI('pk1_key', 'sk1_secret', check_creds=False, http_backend='stdlib')",
+    ],
+)
+def test_requests_is_not_imported_until_needed(code):
+    subprocess.run([sys.executable, "-c", f"import sys; {code}; assert 'requests' not in sys.modules"], check=True)
+
+
+def test_requests_client_imports_requests():
+    code = "import sys, pypork; pypork.PorkbunAPI('pk1_key', 'sk1_secret', check_creds=False); assert 'requests' in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
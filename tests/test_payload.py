@@ -0,0 +1,26 @@
+__author__ = "Urufusan"
+__copyright__ = "Urufusan"
+__license__ = "AGPL-3.0-or-later"
+
+
+def test_payload_includes_auth_and_stringified_numbers(make_client):
+    pb = make_client(domain="example.com")
+    pb.create_dns_record(name="", record_type="MX", content="mail.example.com", ttl=300, prio=10)
+    (_, payload), = pb._send.calls
+    assert payload == {
+        "apikey": "pk1_key",
+        "secretapikey": "sk1_secret",
+        "name": "",
+        "type": "MX",
+        "content": "mail.example.com",
+        "ttl": "300",
+        "prio": "10",
+    }
+    assert pb._auth_payload == {"apikey": "pk1_key", "secretapikey": "sk1_secret"}
+
+
+def test_payload_without_data_is_the_auth_dict(make_client):
+    pb = make_client()
+    pb.get_domain_pricing()
+    (_, payload), = pb._send.calls
+    assert payload is pb._auth_payload
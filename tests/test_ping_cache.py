@@ -0,0 +1,48 @@
+from pypork import base_api
+from pypork.base_api import PorkbunAPI
+
+__author__ = "Urufusan"
+__copyright__ = "Urufusan"
+__license__ = "AGPL-3.0-or-later"
+
+
+def ping_response(ip="192.0.2.10"):
+    return lambda url, payload: {"status": "SUCCESS", "yourIp": ip} if url.endswith("/ping") else {"status": "SUCCESS"}
+
+
+def test_ping_is_cached_per_endpoint(make_client):
+    pb = make_client(ping_response())
+    pb.ping()
+    pb.ping()
+    pb.ping(ipv4only=True)
+    assert [url for url, _ in pb._send.calls] == [f"{PorkbunAPI.BASE_URL}/ping", f"{PorkbunAPI.V4ONLYPINGURI}/ping"]
+
+
+def test_ping_force_and_expiry(monkeypatch, make_client):
+    now = [1000.0]
+    monkeypatch.setattr(base_api.time, "monotonic", lambda: now[0])
+    pb = make_client(ping_response())
+    pb.ping()
+    pb.ping(force=True)
+    assert len(pb._send.calls) == 2
+    now[0] += pb.ping_ttl - 1
+    pb.ping()
+    assert len(pb._send.calls) == 2
+    now[0] += 2
+    pb.ping()
+    assert len(pb._send.calls) == 3
+
+
+def test_ping_errors_are_not_cached(make_client):
+    pb = make_client(lambda url, payload: {"status": "ERROR", "message": "Invalid API key"})
+    pb.ping()
+    pb.ping()
+    assert len(pb._send.calls) == 2
+
+
+def test_ping_returns_independent_copies(make_client):
+    pb = make_client(ping_response())
+    pb.ping()["yourIp"] = "tampered"
+    pb.ping().clear()
+    assert pb.ping()["yourIp"] == "192.0.2.10"
+    assert len(pb._send.calls) == 1
@@ -0,0 +1,91 @@
+import pytest
+
+from pypork import base_api
+
+__author__ = "Urufusan"
+__copyright__ = "Urufusan"
+__license__ = "AGPL-3.0-or-later"
+
+
+def records_response(*ttls):
+    def respond(url, payload):
+        if "/retrieve" in url or "/getNs/" in url:
+            return {"status": "SUCCESS", "records": [{"id": str(i), "ttl": str(ttl)} for i, ttl in enumerate(ttls)]}
+        return {"status": "SUCCESS"}
+
+    return respond
+
+
+def test_read_cache_is_off_by_default(make_client):
+    pb = make_client(records_response(600), domain="example.com")
+    pb.get_dns_records()
+    pb.get_dns_records()
+    assert len(pb._send.calls) == 2
+
+
+def test_read_cache_uses_lowest_record_ttl(monkeypatch, make_client):
+    now = [1000.0]
+    monkeypatch.setattr(base_api.time, "monotonic", lambda: now[0])
+    pb = make_client(records_response(600, 300), domain="example.com", read_cache=True)
+    pb.get_dns_records()
+    now[0] += 299
+    pb.get_dns_records()
+    assert len(pb._send.calls) == 1
+    now[0] += 2
+    pb.get_dns_records()
+    assert len(pb._send.calls) == 2
+
+
+def test_read_cache_default_ttl_without_records(monkeypatch, make_client):
+    now = [1000.0]
+    monkeypatch.setattr(base_api.time, "monotonic", lambda: now[0])
+    pb = make_client(domain="example.com", read_cache=True)
+    pb.get_name_servers()
+    now[0] += pb.read_cache_default_ttl - 1
+    pb.get_name_servers()
+    assert len(pb._send.calls) == 1
+    now[0] += 2
+    pb.get_name_servers()
+    assert len(pb._send.calls) == 2
+
+
+def test_read_cache_bypass_and_errors(make_client):
+    pb = make_client(records_response(600), domain="example.com", read_cache=True)
+    pb.get_dns_records()
+    pb.get_dns_records(bypass_cache=True)
+    assert len(pb._send.calls) == 2
+    pb._send.respond = lambda url, payload: {"status": "ERROR", "message": "Invalid domain"}
+    pb.get_dns_records("other.com")
+    pb.get_dns_records("other.com")
+    assert len(pb._send.calls) == 4
+
+
+def test_read_cache_returns_independent_copies(make_client):
+    pb = make_client(records_response(600, 600), domain="example.com", read_cache=True)
+    first = pb.get_dns_records()
+    first["records"].pop()
+    second = pb.get_dns_records()
+    second["records"].clear()
+    assert len(pb.get_dns_records()["records"]) == 2
+    assert len(pb._send.calls) == 1
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda pb: pb.create_dns_record(name="www", record_type="A", content="192.0.2.1"),
+        lambda pb: pb.edit_dns_record(record_id=1, name="www", record_type="A", content="192.0.2.1"),
+        lambda pb: pb.delete_dns_record(record_id=1),
+        lambda pb: pb.edit_dns_record_by_name_type(record_type="A", content="192.0.2.1", subdomain="www"),
+        lambda pb: pb.delete_dns_record_by_name_type(record_type="A", subdomain="www"),
+        lambda pb: pb.update_name_servers(name_servers=["ns1.example.net"]),
+    ],
+)
+def test_writes_invalidate_reads_for_their_domain_only(write, make_client):
+    pb = make_client(records_response(600), domain="example.com", read_cache=True)
+    pb.get_dns_records()
+    pb.get_dns_records_by_name_type(record_type="A", subdomain="www")
+    pb.get_name_servers()
+    pb.get_dns_records("other.com")
+    write(pb)
+    assert list(pb._read_cache) == ["dns/retrieve/other.com"]
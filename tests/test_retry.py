@@ -0,0 +1,37 @@
+import pytest
+
+from pypork.base_api import PorkbunAPI
+
+__author__ = "Urufusan"
+__copyright__ = "Urufusan"
+__license__ = "AGPL-3.0-or-later"
+
+
+@pytest.fixture
+def retry():
+    pb = PorkbunAPI("pk1_key", "sk1_secret", check_creds=False, retries=5, backoff_factor=0.5)
+    return pb._session.get_adapter("https://api.porkbun.com/api/json/v3/ping").max_retries
+
+
+def test_retry_settings(retry):
+    assert retry.total == 5
+    assert retry.backoff_factor == 0.5
+    assert retry.read is False
+    assert retry.raise_on_status is False
+
+
+@pytest.mark.parametrize(
+    "status, has_retry_after, expected",
+    [
+        (429, False, True),
+        (429, True, True),
+        (503, True, True),
+        (503, False, False),
+        (500, False, False),
+        (502, False, False),
+        (504, False, False),
+        (504, True, False),
+    ],
+)
+def test_only_unapplied_statuses_are_retried(retry, status, has_retry_after, expected):
+    assert retry.is_retry("POST", status, has_retry_after=has_retry_after) is expected
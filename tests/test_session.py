@@ -0,0 +1,35 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from pypork import base_api
+from pypork.base_api import PorkbunAPI
+
+__author__ = "Urufusan"
+__copyright__ = "Urufusan"
+__license__ = "AGPL-3.0-or-later"
+
+
+def test_clients_share_session_across_accounts():
+    pb1 = PorkbunAPI("pk1_one", "sk1_one", check_creds=False)
+    pb2 = PorkbunAPI("pk1_two", "sk1_two", check_creds=False)
+    assert pb1._session is pb2._session
+
+
+def test_sessions_are_keyed_by_retry_settings():
+    default = PorkbunAPI("pk1_key", "sk1_secret", check_creds=False)._session
+    assert PorkbunAPI("pk1_key", "sk1_secret", check_creds=False, retries=0)._session is not default
+    assert PorkbunAPI("pk1_key", "sk1_secret", check_creds=False, backoff_factor=1)._session is not default
+    assert base_api._get_session(3, 0.3) is default
+
+
+def test_concurrent_first_use_creates_one_session():
+    with ThreadPoolExecutor(8) as pool:
+        sessions = list(pool.map(lambda _: base_api._get_session(7, 0.1), range(32)))
+    assert all(session is sessions[0] for session in sessions)
+
+
+def test_session_carries_no_credentials():
+    pb = PorkbunAPI("pk1_key", "sk1_secret", check_creds=False)
+    headers = pb._session.headers
+    assert base_api._HEADERS.items() <= headers.items()
+    assert not any("pk1_key" in value or "sk1_secret" in value for value in headers.values())
+    assert pb._session.auth is None
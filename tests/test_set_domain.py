@@ -0,0 +1,42 @@
+import pytest
+
+from pypork.base_api import PorkbunAPI
+
+__author__ = "Urufusan"
+__copyright__ = "Urufusan"
+__license__ = "AGPL-3.0-or-later"
+
+
+def test_set_domain_uses_default_domain(make_client):
+    pb = make_client(domain="example.com")
+    pb.get_dns_records()
+    pb.get_dns_records(domain=None)
+    assert pb._send.endpoints == ["dns/retrieve/example.com", "dns/retrieve/example.com"]
+
+
+def test_set_domain_explicit_domain_wins(make_client):
+    pb = make_client(domain="example.com")
+    pb.get_dns_records("other.com")
+    pb.get_dns_records(domain="third.com")
+    pb.create_dns_record("other.com", "www", "A", "192.0.2.1")
+    assert pb._send.endpoints == ["dns/retrieve/other.com", "dns/retrieve/third.com", "dns/create/other.com"]
+
+
+def test_set_domain_keyword_arguments_with_default_domain(make_client):
+    pb = make_client(domain="example.com")
+    pb.create_dns_record(name="www", record_type="a", content="192.0.2.1")
+    (url, payload), = pb._send.calls
+    assert url.endswith("dns/create/example.com")
+    assert payload["type"] == "A"
+
+
+def test_set_domain_without_any_domain(make_client):
+    pb = make_client()
+    with pytest.raises(TypeError):
+        pb.get_dns_records()
+    assert pb._send.calls == []
+
+
+def test_set_domain_preserves_metadata():
+    assert PorkbunAPI.get_dns_records.__name__ == "get_dns_records"
+    assert "DNS records" in PorkbunAPI.get_dns_records.__doc__
@@ -0,0 +1,127 @@
+import http.client
+import json
+import socket
+
+import pytest
+
+from pypork.base_api import PorkbunAPI, PorkbunError
+
+__author__ = "Urufusan"
+__copyright__ = "Urufusan"
+__license__ = "AGPL-3.0-or-later"
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    def read(self):
+        return self.body
+
+
+class FakeHTTPSConnection:
+    """
+    Records every connection and request.
+
+    ``failures`` maps a (1-based) request number to ``(stage, exception)``, raised from ``request()`` when
+    ``stage`` is ``"send"`` or from ``getresponse()`` when it is ``"response"``.
+    """
+
+    instances = []
+    requests = 0
+    failures = {}
+
+    def __init__(self, host, timeout=None):
+        self.host = host
+        self.closed = False
+        FakeHTTPSConnection.instances.append(self)
+
+    def request(self, method, path, body, headers):
+        FakeHTTPSConnection.requests += 1
+        self.number = FakeHTTPSConnection.requests
+        self.path = path
+        stage, exc = FakeHTTPSConnection.failures.get(self.number, (None, None))
+        if stage == "send":
+            raise exc
+
+    def getresponse(self):
+        stage, exc = FakeHTTPSConnection.failures.get(self.number, (None, None))
+        if stage == "response":
+            raise exc
+        return FakeResponse(json.dumps({"status": "SUCCESS", "path": self.path}).encode())
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_https(monkeypatch):
+    monkeypatch.setattr(http.client, "HTTPSConnection", FakeHTTPSConnection)
+    FakeHTTPSConnection.instances = []
+    FakeHTTPSConnection.requests = 0
+    FakeHTTPSConnection.failures = {}
+    return FakeHTTPSConnection
+
+
+@pytest.fixture
+def pb():
+    return PorkbunAPI("pk1_key", "sk1_secret", check_creds=False, http_backend="stdlib")
+
+
+def test_stdlib_backend_reuses_connection(fake_https, pb):
+    assert pb.get_domain_pricing()["path"] == "/api/json/v3/pricing/get"
+    pb.get_domain_pricing()
+    assert len(fake_https.instances) == 1
+    pb.close()
+    assert fake_https.instances[0].closed
+
+
+def test_stale_connection_failing_at_send_is_retried_once(fake_https, pb):
+    pb.get_domain_pricing()
+    fake_https.failures = {2: ("send", BrokenPipeError())}
+    assert pb.get_domain_pricing()["status"] == "SUCCESS"
+    assert fake_https.requests == 3
+    assert len(fake_https.instances) == 2
+    assert fake_https.instances[0].closed
+
+
+def test_fresh_connection_failing_at_send_is_not_retried(fake_https, pb):
+    fake_https.failures = {1: ("send", ConnectionResetError())}
+    with pytest.raises(ConnectionResetError):
+        pb.get_domain_pricing()
+    assert fake_https.requests == 1
+    assert pb._stdlib_conns == {}
+
+
+@pytest.mark.parametrize("reuse", [False, True])
+def test_failure_after_send_is_not_retried(reuse, fake_https, pb):
+    if reuse:
+        pb.get_domain_pricing()
+    fake_https.failures = {fake_https.requests + 1: ("response", http.client.RemoteDisconnected("closed"))}
+    with pytest.raises(http.client.RemoteDisconnected):
+        pb.create_dns_record("example.com", "www", "A", "192.0.2.1")
+    assert fake_https.requests == int(reuse) + 1
+    assert pb._stdlib_conns == {}
+
+
+@pytest.mark.parametrize(
+    "stage, exc, raised",
+    [
+        ("send", socket.gaierror(-2, "Name or service not known"), socket.gaierror),
+        ("send", OSError("Network is unreachable"), OSError),
+        ("response", socket.timeout("timed out"), PorkbunError),
+        ("response", http.client.BadStatusLine("garbage"), http.client.BadStatusLine),
+    ],
+)
+def test_any_failure_drops_connection(stage, exc, raised, fake_https, pb):
+    fake_https.failures = {1: (stage, exc)}
+    with pytest.raises(raised):
+        pb.get_domain_pricing()
+    assert fake_https.instances[0].closed
+    assert pb.get_domain_pricing()["status"] == "SUCCESS"
+    assert len(fake_https.instances) == 2
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown http_backend"):
+        PorkbunAPI("pk1_key", "sk1_secret", check_creds=False, http_backend="curl")
@@ -0,0 +1,24 @@
+import pytest
+import requests
+
+from pypork.base_api import PorkbunAPI, PorkbunError
+
+__author__ = "Urufusan"
+__copyright__ = "Urufusan"
+__license__ = "AGPL-3.0-or-later"
+
+
+class TimeoutSession:
+    def __init__(self, exc):
+        self.exc = exc
+
+    def post(self, url, json=None, timeout=None):
+        raise self.exc
+
+
+@pytest.mark.parametrize("exc", [requests.ReadTimeout(), requests.ConnectTimeout()])
+def test_timeouts_raise_porkbun_error(exc):
+    pb = PorkbunAPI("pk1_key", "sk1_secret", check_creds=False, timeout=(1, 0.5))
+    pb._session = TimeoutSession(exc)
+    with pytest.raises(PorkbunError, match=r"^timeout after 1\.5s$"):
+        pb.get_domain_pricing()